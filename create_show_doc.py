@@ -16,8 +16,10 @@ from wrestling_logger.cli import (
     prompt_video_ids,
 )
 from wrestling_logger.doc import (
+    GoogleServices,
     ShowMetadata,
     build_document_body,
+    create_and_populate_doc,
     create_google_doc,
     delete_google_doc,
     get_credentials,
@@ -35,8 +37,10 @@ main = _cli_main
 __all__ = [
     "OpenAI",
     "format_document_with_ai",
+    "GoogleServices",
     "ShowMetadata",
     "build_document_body",
+    "create_and_populate_doc",
     "create_google_doc",
     "delete_google_doc",
     "get_credentials",
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    """Point the on-disk cache at a per-test directory so tests stay independent."""
+    monkeypatch.setenv("WRESTLING_LOGGER_CACHE_DIR", str(tmp_path))
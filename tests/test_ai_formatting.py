@@ -44,13 +44,167 @@ def test_ai_formatting_returns_text(monkeypatch):
             self.chat = DummyChat()
 
     monkeypatch.setenv("OPENAI_API_KEY", "testkey")
-    _patch_openai(monkeypatch, lambda api_key=None: DummyClient(api_key=api_key))
+    _patch_openai(monkeypatch, lambda api_key=None, **kwargs: DummyClient(api_key=api_key))
 
     formatted = format_document_with_ai(AI_TEST_PROMPT)
     assert isinstance(formatted, str)
     assert AI_TEST_PROMPT.strip() in formatted
 
 
+def test_concurrent_formatting_uses_async_client(monkeypatch):
+    """concurrency > 1 should fan chunks out through AsyncOpenAI."""
+
+    class DummyAsyncCompletions:
+        def __init__(self):
+            self.call_count = 0
+
+        async def create(self, **kwargs):
+            self.call_count += 1
+            messages = kwargs.get("messages") or []
+            user_text = messages[-1].get("content", "") if len(messages) >= 3 else ""
+            chunk_text = user_text
+            marker_idx = user_text.rfind("\n\n(Chunk")
+            if marker_idx != -1:
+                chunk_text = user_text[:marker_idx]
+
+            class _Message:
+                def __init__(self, content):
+                    self.content = content
+
+            class _Choice:
+                def __init__(self, content):
+                    self.message = _Message(content)
+
+            return type("Resp", (), {"choices": [_Choice(chunk_text)]})()
+
+    dummy_completions = DummyAsyncCompletions()
+
+    class DummyAsyncClient:
+        def __init__(self, api_key=None, **kwargs):
+            self.chat = type("Chat", (), {"completions": dummy_completions})()
+
+        async def close(self):
+            pass
+
+    monkeypatch.setenv("OPENAI_API_KEY", "testkey")
+    monkeypatch.setattr("wrestling_logger.ai_format.AsyncOpenAI", DummyAsyncClient)
+    monkeypatch.setattr("wrestling_logger.ai_format.DefaultAioHttpClient", None)
+
+    long_doc = ("START\n" + AI_TEST_PROMPT + "\n") + (AI_TEST_PROMPT * 300) + ("\nEND")
+    formatted = format_document_with_ai(long_doc, model="gpt-5-nano", concurrency=4)
+    assert "START" in formatted
+    assert "END" in formatted
+    assert dummy_completions.call_count > 1
+
+
+def test_formatted_chunks_are_cached(monkeypatch):
+    """A repeat run over the same content should be served from the chunk cache."""
+
+    class DummyCompletions:
+        def __init__(self):
+            self.call_count = 0
+
+        def create(self, **kwargs):
+            self.call_count += 1
+
+            class _Message:
+                def __init__(self):
+                    self.content = AI_TEST_PROMPT
+
+            class _Choice:
+                def __init__(self):
+                    self.message = _Message()
+
+            return type("Resp", (), {"choices": [_Choice()]})()
+
+    dummy_completions = DummyCompletions()
+
+    class DummyChat:
+        def __init__(self):
+            self.completions = dummy_completions
+
+    class DummyClient:
+        def __init__(self, api_key=None):
+            self.chat = DummyChat()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "testkey")
+    _patch_openai(monkeypatch, lambda api_key=None, **kwargs: DummyClient(api_key=api_key))
+
+    first = format_document_with_ai(AI_TEST_PROMPT, model="gpt-5-nano")
+    second = format_document_with_ai(AI_TEST_PROMPT, model="gpt-5-nano")
+    assert first == second
+    assert dummy_completions.call_count == 1
+
+
+def test_already_formatted_content_skips_api(monkeypatch):
+    """Content that already carries '*** ... ***' headers should pass through."""
+
+    class DummyClient:
+        def __init__(self, api_key=None):
+            raise AssertionError("no client should be constructed for formatted content")
+
+    monkeypatch.setenv("OPENAI_API_KEY", "testkey")
+    _patch_openai(monkeypatch, lambda api_key=None, **kwargs: DummyClient(api_key=api_key))
+
+    formatted_doc = (
+        "2025-11-10 | WWE | RAW\n\n"
+        "*** PLAY BY PLAY ANALYSIS ***\n\ntext\n\n"
+        "*** YOUR ANGLE ***\n\nnotes\n\n"
+        "*** TRANSCRIPT SUMMARY ***\n"
+    )
+    assert format_document_with_ai(formatted_doc) == formatted_doc
+
+
+def test_batch_mode_roundtrip(monkeypatch):
+    """use_batch should submit one Batch job and reassemble outputs by custom_id."""
+    import json as _json
+
+    class DummyFiles:
+        def __init__(self, outputs):
+            self.uploaded = None
+            self._outputs = outputs
+
+        def create(self, file=None, purpose=None):
+            assert purpose == "batch"
+            self.uploaded = file
+            return type("F", (), {"id": "file-1"})()
+
+        def content(self, file_id):
+            assert file_id == "file-out"
+            return type("C", (), {"text": self._outputs})()
+
+    class DummyBatches:
+        def create(self, **kwargs):
+            assert kwargs["input_file_id"] == "file-1"
+            assert kwargs["endpoint"] == "/v1/chat/completions"
+            return type(
+                "B", (), {"id": "batch-1", "status": "completed", "output_file_id": "file-out"}
+            )()
+
+        def retrieve(self, batch_id):
+            raise AssertionError("batch completed immediately; no polling expected")
+
+    output_line = _json.dumps(
+        {
+            "custom_id": "chunk-1",
+            "response": {
+                "body": {"choices": [{"message": {"content": AI_TEST_PROMPT}}]}
+            },
+        }
+    )
+
+    class DummyClient:
+        def __init__(self, api_key=None):
+            self.files = DummyFiles(output_line)
+            self.batches = DummyBatches()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "testkey")
+    _patch_openai(monkeypatch, lambda api_key=None, **kwargs: DummyClient(api_key=api_key))
+
+    formatted = format_document_with_ai(AI_TEST_PROMPT, use_batch=True)
+    assert AI_TEST_PROMPT.strip() in formatted
+
+
 def test_other_features_placeholder() -> None:  # pragma: no cover
     """Placeholder for future tests covering the rest of the script."""
     pytest.skip("Pending future feature tests")
@@ -87,7 +241,7 @@ def test_model_param_selection(monkeypatch):
             self.chat = DummyChat()
 
     monkeypatch.setenv("OPENAI_API_KEY", "testkey")
-    _patch_openai(monkeypatch, lambda api_key=None: DummyClient(api_key=api_key))
+    _patch_openai(monkeypatch, lambda api_key=None, **kwargs: DummyClient(api_key=api_key))
 
     # Call with a gpt-5 model name
     formatted = format_document_with_ai(AI_TEST_PROMPT, model="gpt-5-nano")
@@ -115,29 +269,16 @@ def test_chunking_long_input(monkeypatch):
         def create(self, **kwargs):
             self.call_count += 1
             messages = kwargs.get("messages") or []
-            # The chunked content is in the user's message (index 1) after the
-            # instructions; slice out the tail which contains the chunk text.
-            user_text = ""
-            if len(messages) >= 2:
-                user_text = messages[1].get("content", "")
-                # Attempt to find the start of the chunk by searching for the
-                # chunk marker we insert in the prompt: '(Chunk'. Fallback to
-                # returning the whole user_text if marker not found.
-                marker = "(Chunk"
-                marker_idx = user_text.find(marker)
+            # The chunk text lives in the final user message (the static
+            # instructions are a separate cache-friendly message) with the
+            # '(Chunk i/N)' counter appended after it; strip that suffix.
+            chunk_text = ""
+            if len(messages) >= 3:
+                user_text = messages[-1].get("content", "")
+                chunk_text = user_text
+                marker_idx = user_text.rfind("\n\n(Chunk")
                 if marker_idx != -1:
-                    # The actual chunk content follows the marker line after
-                    # a blank line; find the first blank-line separator.
-                    sep = "\n\n"
-                    sep_idx = user_text.find(sep, marker_idx)
-                    if sep_idx != -1:
-                        chunk_text = user_text[sep_idx + len(sep) :]
-                    else:
-                        chunk_text = user_text[marker_idx:]
-                else:
-                    chunk_text = user_text
-            else:
-                chunk_text = ""
+                    chunk_text = user_text[:marker_idx]
 
             class _Message:
                 def __init__(self, content):
@@ -160,7 +301,7 @@ def test_chunking_long_input(monkeypatch):
             self.chat = DummyChat()
 
     monkeypatch.setenv("OPENAI_API_KEY", "testkey")
-    _patch_openai(monkeypatch, lambda api_key=None: DummyClient(api_key=api_key))
+    _patch_openai(monkeypatch, lambda api_key=None, **kwargs: DummyClient(api_key=api_key))
 
     # Build a long document that contains a clear START and END marker.
     long_doc = ("START\n" + AI_TEST_PROMPT + "\n") + (AI_TEST_PROMPT * 300) + ("\nEND")
@@ -205,7 +346,7 @@ def test_chunk_empty_response_fallback(monkeypatch):
             self.chat = DummyChat()
 
     monkeypatch.setenv("OPENAI_API_KEY", "testkey")
-    _patch_openai(monkeypatch, lambda api_key=None: DummyClient(api_key=api_key))
+    _patch_openai(monkeypatch, lambda api_key=None, **kwargs: DummyClient(api_key=api_key))
 
     formatted = format_document_with_ai(AI_TEST_PROMPT, model="gpt-5-nano")
     assert formatted.strip() == AI_TEST_PROMPT.strip()
@@ -247,7 +388,7 @@ def test_message_content_list_is_parsed(monkeypatch):
             self.chat = DummyChat()
 
     monkeypatch.setenv("OPENAI_API_KEY", "testkey")
-    _patch_openai(monkeypatch, lambda api_key=None: DummyClient(api_key=api_key))
+    _patch_openai(monkeypatch, lambda api_key=None, **kwargs: DummyClient(api_key=api_key))
 
     formatted = format_document_with_ai("header\nbody", model="gpt-4o")
     assert "START" in formatted
@@ -1,19 +1,19 @@
 import pytest
 from unittest.mock import MagicMock, patch
-from wrestling_logger.doc import create_google_doc, write_doc_content
+from wrestling_logger.doc import create_and_populate_doc, create_google_doc, write_doc_content
 from googleapiclient.errors import HttpError
 
 @patch("wrestling_logger.doc.build")
 def test_create_google_doc_success(mock_build):
     mock_service = MagicMock()
     mock_build.return_value = mock_service
-    mock_service.files.return_value.create.return_value.execute.return_value = {"id": "doc123"}
+    mock_service.documents.return_value.create.return_value.execute.return_value = {"documentId": "doc123"}
     
     creds = MagicMock()
     doc_id = create_google_doc("My Doc", creds)
     
     assert doc_id == "doc123"
-    mock_service.files.return_value.create.assert_called_once()
+    mock_service.documents.return_value.create.assert_called_once()
 
 @patch("wrestling_logger.doc.build")
 def test_write_doc_content_success(mock_build):
@@ -25,6 +25,33 @@ def test_write_doc_content_success(mock_build):
     
     mock_service.documents.return_value.batchUpdate.assert_called_once()
 
+@patch("wrestling_logger.doc.build")
+def test_write_doc_content_chunks_large_content(mock_build):
+    mock_service = MagicMock()
+    mock_build.return_value = mock_service
+
+    creds = MagicMock()
+    content = ("line of transcript text\n" * 20_000).strip()  # ~480KB
+    write_doc_content("doc123", content, creds)
+
+    _, kwargs = mock_service.documents.return_value.batchUpdate.call_args
+    requests = kwargs["body"]["requests"]
+    assert len(requests) > 1
+    assert "".join(req["insertText"]["text"] for req in requests) == content
+
+@patch("wrestling_logger.doc.build")
+def test_create_and_populate_doc_success(mock_build):
+    mock_service = MagicMock()
+    mock_build.return_value = mock_service
+    mock_service.documents.return_value.create.return_value.execute.return_value = {"documentId": "doc123"}
+
+    creds = MagicMock()
+    doc_id = create_and_populate_doc("My Doc", "content", creds)
+
+    assert doc_id == "doc123"
+    mock_service.documents.return_value.create.assert_called_once()
+    mock_service.documents.return_value.batchUpdate.assert_called_once()
+
 @patch("wrestling_logger.doc.build")
 def test_create_google_doc_failure(mock_build):
     mock_service = MagicMock()
@@ -33,7 +60,7 @@ def test_create_google_doc_failure(mock_build):
     # Create a proper HttpError mock
     resp = MagicMock()
     resp.status = 500
-    mock_service.files.return_value.create.return_value.execute.side_effect = HttpError(resp, b'{"error": "fail"}')
+    mock_service.documents.return_value.create.return_value.execute.side_effect = HttpError(resp, b'{"error": "fail"}')
     
     creds = MagicMock()
     with pytest.raises(RuntimeError, match="Unable to create Google Doc"):
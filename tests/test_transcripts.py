@@ -1,10 +1,18 @@
 import pytest
 from unittest.mock import MagicMock, patch
-from wrestling_logger.transcripts import fetch_transcripts, TranscriptResult, TranscriptLookupError
+from wrestling_logger.transcripts import _caption_session, fetch_transcripts, TranscriptResult, TranscriptLookupError
 from yt_dlp.utils import DownloadError
 
+def _mock_caption_session(payload: bytes) -> MagicMock:
+    """Build a session mock whose GET returns `payload` as the body."""
+    mock_session = MagicMock()
+    mock_session.get.return_value.content = payload
+    return mock_session
+
+
+@patch("wrestling_logger.transcripts._caption_session")
 @patch("wrestling_logger.transcripts.YoutubeDL")
-def test_fetch_transcripts_success(mock_ytdl_cls):
+def test_fetch_transcripts_success(mock_ytdl_cls, mock_session_fn):
     # Setup mock
     mock_ytdl = mock_ytdl_cls.return_value
     mock_ytdl.extract_info.return_value = {
@@ -12,17 +20,39 @@ def test_fetch_transcripts_success(mock_ytdl_cls):
             "en": {"url": "http://mock.url", "ext": "json3"}
         }
     }
-    
-    # Mock urlopen response for json3
+
+    # Mock caption download response for json3
+    mock_session_fn.return_value = _mock_caption_session(
+        b'{"events": [{"segs": [{"utf8": "Hello world"}]}]}'
+    )
+
+    results = fetch_transcripts(["video1"])
+
+    assert len(results) == 1
+    assert results[0].success is True
+    assert results[0].video_id == "video1"
+    assert results[0].text == "Hello world"
+
+
+@patch("wrestling_logger.transcripts._caption_session")
+@patch("wrestling_logger.transcripts.YoutubeDL")
+def test_fetch_transcripts_session_falls_back_to_ydl(mock_ytdl_cls, mock_session_fn):
+    mock_ytdl = mock_ytdl_cls.return_value
+    mock_ytdl.extract_info.return_value = {
+        "requested_subtitles": {
+            "en": {"url": "http://mock.url", "ext": "json3"}
+        }
+    }
+
+    # Pooled session fails (e.g. signed URL); yt-dlp's handler still works
+    mock_session_fn.return_value.get.side_effect = ConnectionError("blocked")
     mock_response = MagicMock()
     mock_response.read.return_value = b'{"events": [{"segs": [{"utf8": "Hello world"}]}]}'
     mock_ytdl.urlopen.return_value = mock_response
 
     results = fetch_transcripts(["video1"])
-    
-    assert len(results) == 1
+
     assert results[0].success is True
-    assert results[0].video_id == "video1"
     assert results[0].text == "Hello world"
 
 @patch("wrestling_logger.transcripts.YoutubeDL")
@@ -36,6 +66,44 @@ def test_fetch_transcripts_download_error(mock_ytdl_cls):
     assert results[0].success is False
     assert "Mock download error" in results[0].error
 
+@patch("wrestling_logger.transcripts._caption_session")
+@patch("wrestling_logger.transcripts.YoutubeDL")
+def test_fetch_transcripts_uses_cache(mock_ytdl_cls, mock_session_fn):
+    mock_ytdl = mock_ytdl_cls.return_value
+    mock_ytdl.extract_info.return_value = {
+        "requested_subtitles": {
+            "en": {"url": "http://mock.url", "ext": "json3"}
+        }
+    }
+    mock_session_fn.return_value = _mock_caption_session(
+        b'{"events": [{"segs": [{"utf8": "Hello world"}]}]}'
+    )
+
+    fetch_transcripts(["video1"])
+    # Second run should come from the cache without re-hitting the network
+    mock_ytdl.extract_info.side_effect = AssertionError("cache should have been hit")
+    results = fetch_transcripts(["video1"])
+
+    assert results[0].success is True
+    assert results[0].text == "Hello world"
+
+    # refresh=True bypasses the cache read and goes back to the network
+    mock_ytdl.extract_info.side_effect = DownloadError("Mock download error")
+    results = fetch_transcripts(["video1"], refresh=True)
+    assert results[0].success is False
+
+
+def test_caption_session_keeps_retry_config(monkeypatch):
+    """The real session must keep its retry policy even when the optional
+    cachecontrol layer is installed (caching layers on the adapter, it must
+    not replace it)."""
+    monkeypatch.setattr("wrestling_logger.transcripts._CAPTION_SESSION", None)
+    session = _caption_session()
+    adapter = session.get_adapter("https://example.com")
+    assert adapter.max_retries.total == 3
+    assert 429 in adapter.max_retries.status_forcelist
+
+
 @patch("wrestling_logger.transcripts.YoutubeDL")
 def test_fetch_transcripts_no_transcript(mock_ytdl_cls):
     mock_ytdl = mock_ytdl_cls.return_value
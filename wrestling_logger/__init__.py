@@ -2,8 +2,10 @@
 
 from .cli import main  # noqa: F401
 from .doc import (
+    GoogleServices,
     ShowMetadata,
     build_document_body,
+    create_and_populate_doc,
     create_google_doc,
     delete_google_doc,
     get_credentials,
@@ -14,8 +16,10 @@ from .ai_format import format_document_with_ai, OpenAI
 
 __all__ = [
     "main",
+    "GoogleServices",
     "ShowMetadata",
     "build_document_body",
+    "create_and_populate_doc",
     "create_google_doc",
     "delete_google_doc",
     "get_credentials",
@@ -1,20 +1,21 @@
 """Interactive CLI for building wrestling show documents."""
 from __future__ import annotations
 
+import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List
 
 from . import config
 from .ai_format import format_document_with_ai
 from .doc import (
+    GoogleServices,
     ShowMetadata,
     build_document_body,
-    create_google_doc,
-    delete_google_doc,
+    create_and_populate_doc,
     get_credentials,
-    write_doc_content,
 )
 from .transcripts import fetch_transcripts
 
@@ -49,7 +50,7 @@ def prompt_metadata() -> ShowMetadata:
 
 
 def prompt_play_by_play() -> str:
-    print("## STEP 2: Play-by-Play\n")
+    print("\n## STEP 3: Play-by-Play\n")
     prompt = (
         "Paste your copied Play-by-Play recap text.\n"
         "Finish with a line containing only '::end::' (without quotes)."
@@ -58,7 +59,7 @@ def prompt_play_by_play() -> str:
 
 
 def prompt_personal_notes() -> str:
-    print("\n## STEP 3: YOUR ANGLE (Personal Notes)\n")
+    print("\n## STEP 4: YOUR ANGLE (Personal Notes)\n")
     prompt = (
         "Paste your personal notes.\n"
         "Finish with a line containing only '::end::' (without quotes)."
@@ -67,7 +68,7 @@ def prompt_personal_notes() -> str:
 
 
 def prompt_video_ids() -> List[str]:
-    print("\n## STEP 4: YouTube Transcripts\n")
+    print("## STEP 2: YouTube Transcripts\n")
     raw_ids = _prompt_required("Enter all YouTube video IDs, separated by a comma: ")
     video_ids = [vid.strip() for vid in raw_ids.split(",") if vid.strip()]
     if not video_ids:
@@ -75,15 +76,36 @@ def prompt_video_ids() -> List[str]:
     return video_ids
 
 
-def main() -> None:
+def _parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build a wrestling show Master Doc.")
+    parser.add_argument(
+        "--refresh-metadata",
+        action="store_true",
+        help="Re-fetch transcripts from YouTube even when a cached copy exists.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = _parse_args(argv)
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     print("Starting the wrestling logger...")
     print("This script will build your Master Doc.\n")
     metadata = prompt_metadata()
-    recap_text = prompt_play_by_play()
-    personal_notes = prompt_personal_notes()
     video_ids = prompt_video_ids()
-    transcript_results = fetch_transcripts(video_ids)
+
+    # The human is the bottleneck for the next two prompts; fetch the
+    # transcripts and warm the Google credentials in the background while
+    # they type, so total wall-clock is max(typing, network) not the sum.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        transcripts_future = executor.submit(
+            fetch_transcripts, video_ids, refresh=args.refresh_metadata
+        )
+        creds_future = executor.submit(get_credentials)
+        recap_text = prompt_play_by_play()
+        personal_notes = prompt_personal_notes()
+        transcript_results = transcripts_future.result()
+        creds = creds_future.result()
 
     doc_body = build_document_body(metadata, recap_text, personal_notes, transcript_results)
 
@@ -94,12 +116,7 @@ def main() -> None:
     successes = sum(1 for result in transcript_results if result.success)
     print(f" - Transcript successes: {successes}/{len(transcript_results)}")
     print("\n## STEP 5: BUILDING DOCUMENT")
-    logger.info("Authenticating with Google...")
-    creds = get_credentials()
-    logger.info("Creating new Google Doc...")
-    doc_id = create_google_doc(metadata.doc_title, creds)
-    logger.info(f"... New Doc ID: {doc_id}")
-    logger.info("Writing sections to doc...")
+    services = GoogleServices.from_credentials(creds)
     use_ai = False
     try:
         use_ai = _prompt_yes_no("Would you like to format this document with OpenAI (gpt-5-nano)? (y/N): ")
@@ -109,22 +126,22 @@ def main() -> None:
     if use_ai:
         try:
             logger.info("Formatting document with AI...")
-            doc_body = format_document_with_ai(doc_body, model=config.OPENAI_MODEL)
+            doc_body = format_document_with_ai(
+                doc_body,
+                model=config.OPENAI_MODEL,
+                concurrency=config.OPENAI_CONCURRENCY,
+            )
             logger.info("AI formatting applied successfully.")
         except Exception as exc:  # noqa: BLE001
             logger.error(f"AI formatting failed: {exc}")
             logger.info("Continuing with unformatted document.")
+    logger.info("Creating and writing the Google Doc...")
     try:
-        write_doc_content(doc_id, doc_body, creds)
+        doc_id = create_and_populate_doc(metadata.doc_title, doc_body, creds, services=services)
     except RuntimeError as exc:
         logger.error(f"Writing failed: {exc}")
-        logger.info("Cleaning up the placeholder doc...")
-        try:
-            delete_google_doc(doc_id, creds)
-            logger.info("Placeholder doc removed.")
-        except Exception:  # noqa: BLE001
-            logger.warning("Unable to remove the placeholder doc; please delete it manually.")
         raise
+    logger.info(f"... New Doc ID: {doc_id}")
     print("... Success!\n")
     print("Your new document is ready in your Google Drive.")
     print(f"https://docs.google.com/document/d/{doc_id}/edit")
@@ -150,14 +167,15 @@ def _prompt_required(message: str) -> str:
 
 def _read_multiline(prompt: str) -> str:
     print(prompt)
+    # Iterating stdin directly uses the C-level buffered reader, which beats
+    # a readline() call per line on large paste buffers.
     lines: List[str] = []
-    while True:
-        line = sys.stdin.readline()
-        if not line:
-            break
-        if line.strip() == "::end::":
+    append = lines.append
+    for line in sys.stdin:
+        stripped = line.rstrip("\n")
+        if stripped.strip() == "::end::":
             break
-        lines.append(line.rstrip("\n"))
+        append(stripped)
     content = "\n".join(lines).strip()
     if not content:
         raise ValueError("Input cannot be empty. Please paste your text before typing ::end::")
@@ -12,6 +12,12 @@ SCOPES: List[str] = [
 CREDENTIALS_FILE: str = os.getenv("WRESTLING_LOGGER_CREDENTIALS", "credentials.json")
 TOKEN_FILE: str = os.getenv("WRESTLING_LOGGER_TOKEN", "token.json")
 
+# Cache settings
+CACHE_DIR_ENV: str = "WRESTLING_LOGGER_CACHE_DIR"
+DEFAULT_CACHE_DIR: str = os.path.join("~", ".cache", "wrestling_logger")
+CACHE_TTL_ENV: str = "WRESTLING_LOGGER_CACHE_TTL"
+DEFAULT_CACHE_TTL_SECONDS: int = 7 * 24 * 60 * 60
+
 # Transcript settings
 DEFAULT_TRANSCRIPT_LANGUAGES: List[str] = ["en", "en-US"]
 COOKIES_FILE_ENV: str = "YTDLP_COOKIES_FILE"
@@ -19,3 +25,4 @@ COOKIES_BROWSER_ENV: str = "YTDLP_COOKIES_FROM_BROWSER"
 
 # OpenAI settings
 OPENAI_MODEL: str = "gpt-5-nano"
+OPENAI_CONCURRENCY: int = 8
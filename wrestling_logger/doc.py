@@ -1,24 +1,94 @@
 """Document construction and Google Docs helpers."""
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
-import re
 from dataclasses import dataclass
 from typing import List
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-
 from . import config
 from .transcripts import TranscriptResult
 
 logger = logging.getLogger(__name__)
 
+# The Google client stack is slow to import and only needed once a doc is
+# actually built, so it is loaded on first use. The names stay module-level
+# so callers (and tests) can patch them.
+Request = None  # type: ignore[assignment]
+Credentials = None  # type: ignore[assignment]
+InstalledAppFlow = None  # type: ignore[assignment]
+build = None  # type: ignore[assignment]
+HttpError = None  # type: ignore[assignment]
+
+
+def _ensure_google() -> None:
+    global Request, Credentials, InstalledAppFlow, build, HttpError
+    if HttpError is None:
+        from googleapiclient.errors import HttpError as _HttpError
+
+        HttpError = _HttpError
+    if build is None:
+        from googleapiclient.discovery import build as _build
+
+        build = _build
+    if Credentials is None:
+        from google.oauth2.credentials import Credentials as _Credentials
+
+        Credentials = _Credentials
+    if Request is None:
+        from google.auth.transport.requests import Request as _Request
+
+        Request = _Request
+    if InstalledAppFlow is None:
+        from google_auth_oauthlib.flow import InstalledAppFlow as _InstalledAppFlow
+
+        InstalledAppFlow = _InstalledAppFlow
+
+
+@dataclass
+class GoogleServices:
+    """Drive and Docs service objects built once and reused across API calls.
+
+    Each ``build()`` constructs a resource from the discovery document;
+    building both services up front (with the bundled static schema, so no
+    discovery round-trip) avoids paying that cost again per helper call.
+    """
+
+    drive: object
+    docs: object
+
+    @classmethod
+    def from_credentials(cls, creds: Credentials) -> "GoogleServices":
+        _ensure_google()
+        return cls(
+            drive=build(
+                "drive", "v3", credentials=creds, cache_discovery=False, static_discovery=True
+            ),
+            docs=build(
+                "docs", "v1", credentials=creds, cache_discovery=False, static_discovery=True
+            ),
+        )
+
+
+@functools.lru_cache(maxsize=4)
+def _services_for(creds: Credentials) -> GoogleServices:
+    """Build (once per credentials object) the services for the no-``services`` path.
+
+    The doc helpers accept an explicit ``GoogleServices`` for callers that
+    already hold one; when they do not, this cache keeps the fallback path
+    from re-running discovery and a TLS handshake on every call.
+    """
+    return GoogleServices.from_credentials(creds)
+
+
+def _norm_title_part(value: str, default: str) -> str:
+    # split()/join collapses any whitespace run without the regex engine,
+    # which is noticeably cheaper on the short strings titles are made of.
+    parts = value.strip().upper().split()
+    return "_".join(parts) if parts else default
+
 
 @dataclass
 class ShowMetadata:
@@ -27,11 +97,13 @@ class ShowMetadata:
     show_name: str
     show_type: str = "TV"
 
-    @property
+    @functools.cached_property
     def doc_title(self) -> str:
-        promo = re.sub(r"\s+", "_", self.promotion.strip().upper()) or "PROMO"
-        show = re.sub(r"\s+", "_", self.show_name.strip().upper()) or "SHOW"
-        show_type = re.sub(r"\s+", "_", self.show_type.strip().upper()) if self.show_type else "TV"
+        # cached_property: the CLI reads the title several times (prompt echo,
+        # summary, doc creation) and the fields never change after setup.
+        promo = _norm_title_part(self.promotion, "PROMO")
+        show = _norm_title_part(self.show_name, "SHOW")
+        show_type = _norm_title_part(self.show_type or "TV", "TV")
         return f"{self.event_date}_{promo}_{show_type}_{show}"
 
 
@@ -41,36 +113,50 @@ def build_document_body(
     personal_notes: str,
     transcript_results: List[TranscriptResult],
 ) -> str:
-    header = f"{metadata.event_date} | {metadata.promotion} | {metadata.show_name}\n\n"
-    play_by_play_section = f"--- PLAY BY PLAY ANALYSIS ---\n{recap_text.strip()}\n\n"
-    angle_section = f"--- YOUR ANGLE ---\n{personal_notes.strip()}\n\n"
-
-    transcript_lines: List[str] = ["--- HIGHLIGHT TRANSCRIPTS ---"]
+    # Collect fragments in a list and join once at the end: sections (and
+    # transcripts in particular) can each run to 100KB+, and repeated string
+    # concatenation would copy them over and over.
+    parts: List[str] = [
+        f"{metadata.event_date} | {metadata.promotion} | {metadata.show_name}\n\n",
+        "--- PLAY BY PLAY ANALYSIS ---\n",
+        recap_text.strip(),
+        "\n\n--- YOUR ANGLE ---\n",
+        personal_notes.strip(),
+        "\n\n--- HIGHLIGHT TRANSCRIPTS ---\n",
+    ]
+    append = parts.append
     for result in transcript_results:
         if result.success and result.text:
-            transcript_lines.append(
-                f"[Video ID: {result.video_id}]\n{result.text.strip()}\n"
-            )
+            append(f"[Video ID: {result.video_id}]\n")
+            append(result.text.strip())
+            append("\n\n")
         else:
-            transcript_lines.append(
-                f"[Video ID: {result.video_id}] Transcript missing ({result.error}).\n"
-            )
-    transcripts_section = "\n".join(transcript_lines).strip() + "\n\n"
-
-    summary_lines = ["--- TRANSCRIPT SUMMARY ---"]
+            append(f"[Video ID: {result.video_id}] Transcript missing ({result.error}).\n\n")
+    if not transcript_results:
+        append("\n")
+    append("--- TRANSCRIPT SUMMARY ---")
     for result in transcript_results:
         status = "OK" if result.success else "FAILED"
         detail = "ready" if result.success else (result.error or "unknown error")
-        summary_lines.append(f"- {result.video_id}: {status} ({detail})")
-    summary_section = "\n".join(summary_lines)
+        append(f"\n- {result.video_id}: {status} ({detail})")
+    return "".join(parts)
+
 
-    return header + play_by_play_section + angle_section + transcripts_section + summary_section
+# Credentials parsed once per process; repeat get_credentials() calls skip
+# the token.json read/parse entirely while the object is still valid.
+_CREDS_CACHE: Credentials | None = None
 
 
 def get_credentials() -> Credentials:
+    _ensure_google()
+    global _CREDS_CACHE
+    if _CREDS_CACHE is not None and _CREDS_CACHE.valid:
+        return _CREDS_CACHE
+
     creds: Credentials | None = None
     if os.path.exists(config.TOKEN_FILE):
         creds = Credentials.from_authorized_user_file(config.TOKEN_FILE, config.SCOPES)
+    mutated = False
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             logger.info("Refreshing expired credentials...")
@@ -83,40 +169,105 @@ def get_credentials() -> Credentials:
             logger.info("Starting OAuth flow...")
             flow = InstalledAppFlow.from_client_secrets_file(config.CREDENTIALS_FILE, config.SCOPES)
             creds = flow.run_local_server(port=0)
+        mutated = True
+    if mutated:
+        # Only rewrite token.json when the refresh/OAuth branch actually ran.
         with open(config.TOKEN_FILE, "w", encoding="utf-8") as token:
             token.write(creds.to_json())
+    _CREDS_CACHE = creds
     return creds
 
 
-def create_google_doc(title: str, creds: Credentials) -> str:
-    drive_service = build("drive", "v3", credentials=creds)
-    file_metadata = {
-        "name": title,
-        "mimeType": "application/vnd.google-apps.document",
-    }
+def create_google_doc(title: str, creds: Credentials, services: GoogleServices | None = None) -> str:
+    # documents.create returns a documentId directly, so going through the
+    # Docs API saves the Drive round-trip (and the Drive service build) that
+    # the old files.create path needed.
+    _ensure_google()
+    docs_service = (services or _services_for(creds)).docs
     try:
-        file = (
-            drive_service.files()
-            .create(body=file_metadata, fields="id")
-            .execute()
-        )
+        doc = docs_service.documents().create(body={"title": title}).execute()
+    except HttpError as exc:  # noqa: BLE001
+        raise RuntimeError(f"Unable to create Google Doc: {exc}") from exc
+    return doc["documentId"]
+
+
+def create_and_populate_doc(
+    title: str, content: str, creds: Credentials, services: GoogleServices | None = None
+) -> str:
+    """Create a Google Doc and write ``content`` into it in one pass.
+
+    Goes straight through the Docs API (``documents.create`` already returns a
+    documentId), so no separate Drive round-trip is needed. If the write fails
+    the freshly created placeholder is deleted before re-raising.
+    """
+    _ensure_google()
+    docs_service = (services or _services_for(creds)).docs
+    try:
+        doc = docs_service.documents().create(body={"title": title}).execute()
     except HttpError as exc:  # noqa: BLE001
         raise RuntimeError(f"Unable to create Google Doc: {exc}") from exc
-    return file["id"]
+    doc_id = doc["documentId"]
+    try:
+        _insert_content(docs_service, doc_id, content)
+    except RuntimeError:
+        logger.info("Cleaning up the placeholder doc...")
+        try:
+            delete_google_doc(doc_id, creds, services=services)
+            logger.info("Placeholder doc removed.")
+        except Exception:  # noqa: BLE001
+            logger.warning("Unable to remove the placeholder doc; please delete it manually.")
+        raise
+    return doc_id
+
+
+def write_doc_content(
+    doc_id: str, content: str, creds: Credentials, services: GoogleServices | None = None
+) -> None:
+    _ensure_google()
+    docs_service = (services or _services_for(creds)).docs
+    _insert_content(docs_service, doc_id, content)
 
 
-def write_doc_content(doc_id: str, content: str, creds: Credentials) -> None:
-    docs_service = build("docs", "v1", credentials=creds)
-    requests_body = {
-        "requests": [
+# Maximum characters per insertText request. Docs executes the requests of
+# one batchUpdate atomically and in order, so splitting a large body into
+# several requests keeps per-request latency and retry granularity sane
+# without extra round-trips.
+_INSERT_CHUNK_SIZE = 180_000
+
+
+def _split_insert_requests(content: str, chunk_size: int = _INSERT_CHUNK_SIZE) -> List[dict]:
+    requests: List[dict] = []
+    start = 0
+    length = len(content)
+    while start < length:
+        end = min(start + chunk_size, length)
+        if end < length:
+            # Prefer paragraph boundaries, then line boundaries, so a chunk
+            # never ends mid-word.
+            split_at = content.rfind("\n\n", start, end)
+            if split_at <= start:
+                split_at = content.rfind("\n", start, end)
+            if split_at <= start:
+                split_at = end
+        else:
+            split_at = end
+        requests.append(
             {
                 "insertText": {
                     "endOfSegmentLocation": {},
-                    "text": content,
+                    "text": content[start:split_at],
                 }
             }
-        ]
-    }
+        )
+        start = split_at
+    return requests
+
+
+def _insert_content(docs_service, doc_id: str, content: str) -> None:
+    requests = _split_insert_requests(content)
+    if not requests:
+        return
+    requests_body = {"requests": requests}
     try:
         docs_service.documents().batchUpdate(documentId=doc_id, body=requests_body).execute()
     except HttpError as exc:  # noqa: BLE001
@@ -130,12 +281,24 @@ def write_doc_content(doc_id: str, content: str, creds: Credentials) -> None:
         raise RuntimeError(f"Unable to write Google Doc content: {exc}") from exc
 
 
-def delete_google_doc(doc_id: str, creds: Credentials) -> None:
-    drive_service = build("drive", "v3", credentials=creds)
+def delete_google_doc(doc_id: str, creds: Credentials, services: GoogleServices | None = None) -> None:
+    _ensure_google()
+    drive_service = (services or _services_for(creds)).drive
     drive_service.files().delete(fileId=doc_id).execute()
 
 
 def _extract_error_reason(exc: HttpError) -> str | None:
+    # Modern googleapiclient already parses the payload into error_details;
+    # use it when present and only fall back to decoding exc.content on old
+    # versions that lack it.
+    try:
+        for detail in getattr(exc, "error_details", None) or ():
+            if isinstance(detail, dict):
+                reason = detail.get("reason") or detail.get("metadata", {}).get("reason")
+                if reason:
+                    return reason
+    except Exception:  # noqa: BLE001
+        pass
     try:
         payload = json.loads(exc.content.decode("utf-8"))
         details = payload.get("error", {}).get("details")
@@ -5,15 +5,43 @@ import json
 import logging
 import os
 import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import closing
 from dataclasses import dataclass
-from typing import List
-
-from yt_dlp import YoutubeDL
-from yt_dlp.utils import DownloadError
+from itertools import chain
+from typing import Iterator, List
 
 from . import config
 
+# yt-dlp costs hundreds of ms and tens of MB of RSS to import, so it is
+# loaded on first fetch rather than at module import. The names stay
+# module-level so callers (and tests) can patch them.
+YoutubeDL = None  # type: ignore[assignment]
+DownloadError = None  # type: ignore[assignment]
+
+
+def _ensure_ytdlp() -> None:
+    global YoutubeDL, DownloadError
+    if DownloadError is None:
+        from yt_dlp.utils import DownloadError as _DownloadError
+
+        DownloadError = _DownloadError
+    if YoutubeDL is None:
+        from yt_dlp import YoutubeDL as _YoutubeDL
+
+        YoutubeDL = _YoutubeDL
+
+try:  # optional dependency - parses bytes directly, ~3-5x faster than stdlib
+    from orjson import loads as _json_loads
+except Exception:  # pragma: no cover - optional dependency
+
+    def _json_loads(data: bytes):
+        return json.loads(data.decode("utf-8"))
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,30 +57,146 @@ class TranscriptLookupError(Exception):
     """Raised when yt-dlp cannot retrieve a transcript."""
 
 
-def fetch_transcripts(video_ids: List[str], languages: List[str] | None = None) -> List[TranscriptResult]:
+# YouTube throttles aggressive parallel clients; keep concurrency modest.
+MAX_CONCURRENT_FETCHES = 4
+
+# Fetch workers live in one process-wide pool so their threads (and the
+# per-thread YoutubeDL instances below) survive across fetch_transcripts
+# calls instead of being rebuilt every time.
+_FETCH_EXECUTOR: ThreadPoolExecutor | None = None
+_FETCH_EXECUTOR_LOCK = threading.Lock()
+
+# Per-thread YoutubeDL instances, keyed by (class, options) so a changed
+# option set - or a test that patches the YoutubeDL name - gets a fresh
+# instance instead of a stale one.
+_YDL_LOCAL = threading.local()
+
+
+def _fetch_executor() -> ThreadPoolExecutor:
+    global _FETCH_EXECUTOR
+    if _FETCH_EXECUTOR is None:
+        with _FETCH_EXECUTOR_LOCK:
+            if _FETCH_EXECUTOR is None:
+                _FETCH_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=MAX_CONCURRENT_FETCHES,
+                    thread_name_prefix="transcript-fetch",
+                )
+    return _FETCH_EXECUTOR
+
+
+def _thread_ydl(ydl_options: dict) -> YoutubeDL:
+    instances = getattr(_YDL_LOCAL, "instances", None)
+    if instances is None:
+        instances = _YDL_LOCAL.instances = {}
+    key = (YoutubeDL, tuple(sorted((k, repr(v)) for k, v in ydl_options.items())))
+    ydl = instances.get(key)
+    if ydl is None:
+        ydl = instances[key] = YoutubeDL(ydl_options)
+    return ydl
+
+
+class _TranscriptCache:
+    """Sqlite-backed cache of transcript text keyed by video id.
+
+    Repeated runs against the same videos (common while iterating on a doc)
+    skip the yt-dlp metadata fetch and caption download entirely. Entries
+    expire after ``WRESTLING_LOGGER_CACHE_TTL`` seconds (default 7 days).
+    Cache failures are swallowed: the network path always remains available.
+    """
+
+    def __init__(self) -> None:
+        cache_dir = os.path.expanduser(
+            os.getenv(config.CACHE_DIR_ENV, config.DEFAULT_CACHE_DIR)
+        )
+        self._path = os.path.join(cache_dir, "transcripts.sqlite")
+        self._ttl = int(
+            os.getenv(config.CACHE_TTL_ENV, config.DEFAULT_CACHE_TTL_SECONDS)
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        conn = sqlite3.connect(self._path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS transcripts ("
+            "video_id TEXT PRIMARY KEY, lang TEXT, text TEXT, "
+            "fetched_at INTEGER, etag TEXT)"
+        )
+        return conn
+
+    def get(self, video_id: str) -> str | None:
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT text FROM transcripts WHERE video_id = ? AND fetched_at > ?",
+                    (video_id, int(time.time()) - self._ttl),
+                ).fetchone()
+            return row[0] if row else None
+        except Exception:  # noqa: BLE001
+            return None
+
+    def set(self, video_id: str, lang: str, text: str) -> None:
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO transcripts "
+                    "(video_id, lang, text, fetched_at, etag) VALUES (?, ?, ?, ?, NULL)",
+                    (video_id, lang, text, int(time.time())),
+                )
+                conn.commit()
+        except Exception:  # noqa: BLE001
+            logger.debug(f"Unable to cache transcript for '{video_id}'.")
+
+
+def fetch_transcripts(
+    video_ids: List[str],
+    languages: List[str] | None = None,
+    refresh: bool = False,
+) -> List[TranscriptResult]:
+    if not video_ids:
+        return []
+    _ensure_ytdlp()
     preferred_languages = _normalize_languages(languages)
     ydl_options = _build_ytdlp_options(preferred_languages)
-    ydl = YoutubeDL(ydl_options)
-
-    results: List[TranscriptResult] = []
-    logger.info(f"Fetching {len(video_ids)} transcripts...")
-    for video_id in video_ids:
+    cache = _TranscriptCache()
+
+    def _worker(video_id: str) -> TranscriptResult:
+        if not refresh:
+            cached = cache.get(video_id)
+            if cached:
+                logger.info(f"   > Transcript for '{video_id}' CACHED.")
+                return TranscriptResult(video_id=video_id, success=True, text=cached)
+        # yt-dlp is not documented thread-safe, so each worker thread keeps
+        # its own YoutubeDL instance, reused across fetch_transcripts calls.
+        ydl = _thread_ydl(ydl_options)
         try:
             text = _fetch_single_transcript(ydl, video_id, preferred_languages)
-            results.append(TranscriptResult(video_id=video_id, success=True, text=text))
             logger.info(f"   > Transcript for '{video_id}' FOUND.")
+            cache.set(video_id, preferred_languages[0] if preferred_languages else "", text)
+            return TranscriptResult(video_id=video_id, success=True, text=text)
         except TranscriptLookupError as exc:
             err = str(exc)
-            results.append(TranscriptResult(video_id=video_id, success=False, error=err))
             logger.warning(f"   > Transcript for '{video_id}' FAILED: {err}.")
+            return TranscriptResult(video_id=video_id, success=False, error=err)
         except DownloadError as exc:
             err = f"yt-dlp error: {exc}"
-            results.append(TranscriptResult(video_id=video_id, success=False, error=err))
             logger.error(f"   > Transcript for '{video_id}' FAILED: {err}.")
+            return TranscriptResult(video_id=video_id, success=False, error=err)
         except Exception as exc:  # noqa: BLE001
             err = f"Unexpected error: {exc}"
-            results.append(TranscriptResult(video_id=video_id, success=False, error=err))
             logger.error(f"   > Transcript for '{video_id}' FAILED: {err}.")
+            return TranscriptResult(video_id=video_id, success=False, error=err)
+
+    logger.info(f"Fetching {len(video_ids)} transcripts...")
+    # Index results into a pre-sized list so output order matches input order
+    # regardless of completion order.
+    results: List[TranscriptResult] = [None] * len(video_ids)  # type: ignore[list-item]
+    executor = _fetch_executor()
+    futures = {
+        executor.submit(_worker, video_id): index
+        for index, video_id in enumerate(video_ids)
+    }
+    for future in as_completed(futures):
+        results[futures[future]] = future.result()
     return results
 
 
@@ -61,6 +205,10 @@ def _fetch_single_transcript(ydl: YoutubeDL, video_id: str, languages: List[str]
     info = ydl.extract_info(video_url, download=False)
     if not info:
         raise TranscriptLookupError("Unable to fetch video metadata")
+    if isinstance(info, dict):
+        # Drop the bulky parts of the info dict we never look at.
+        info.pop("formats", None)
+        info.pop("thumbnails", None)
 
     text = _extract_caption_text(ydl, info, languages)
     if text:
@@ -84,7 +232,18 @@ def _build_ytdlp_options(languages: List[str]) -> dict:
         "writeautomaticsub": True,
         "subtitleslangs": subtitle_langs,
         "subtitlesformat": "json3",
-        "cachedir": False,
+        # A persistent cachedir lets yt-dlp reuse its extracted YouTube
+        # player JS (one of the largest per-video costs) across videos and
+        # across runs.
+        "cachedir": os.path.join(
+            os.path.expanduser(os.getenv(config.CACHE_DIR_ENV, config.DEFAULT_CACHE_DIR)),
+            "yt-dlp",
+        ),
+        # Only captions are consumed downstream; skip the format/manifest
+        # work that dominates a full metadata extraction.
+        "extractor_args": {"youtube": {"skip": ["dash", "hls"]}},
+        "getcomments": False,
+        "check_formats": False,
     }
 
     cookies_file = os.getenv(config.COOKIES_FILE_ENV)
@@ -97,43 +256,62 @@ def _build_ytdlp_options(languages: List[str]) -> dict:
     return options
 
 
+# How many caption URLs to probe at once when the first candidate fails.
+MAX_CONCURRENT_CAPTION_PROBES = 4
+
+
 def _extract_caption_text(ydl: YoutubeDL, info: dict, languages: List[str]) -> str | None:
-    sources = _ordered_caption_sources(info)
-    if not sources:
+    candidates = _ranked_caption_entries(info, languages)
+    if not candidates:
         return None
-
-    for lang in languages:
-        for source in sources:
-            entries = source.get(lang)
-            if not entries:
-                continue
-            for entry in _ensure_list(entries):
-                text = _download_caption_entry(ydl, entry)
+    if len(candidates) == 1:
+        return _download_caption_entry(ydl, candidates[0])
+
+    # Download a small batch of the best-ranked candidates concurrently and
+    # take the first non-empty result in rank order. Trades a little
+    # bandwidth for much better tail latency when the preferred subtitle
+    # track is missing or empty.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CAPTION_PROBES) as pool:
+        for start in range(0, len(candidates), MAX_CONCURRENT_CAPTION_PROBES):
+            batch = candidates[start : start + MAX_CONCURRENT_CAPTION_PROBES]
+            futures = [pool.submit(_download_caption_entry, ydl, entry) for entry in batch]
+            for future in futures:
+                text = future.result()
                 if text:
                     return text
+    return None
+
+
+def _ranked_caption_entries(info: dict, languages: List[str]) -> List[dict]:
+    """Order caption entries by (language priority, source priority)."""
+    # The preferred-language pass and the fallback pass both iterate the
+    # sources, so materialize the generator once here.
+    sources = tuple(_ordered_caption_sources(info))
+    candidates: List[dict] = []
+    seen_urls: set[str] = set()
 
+    def _add(entry: dict) -> None:
+        url = entry.get("url")
+        if url and url not in seen_urls:
+            seen_urls.add(url)
+            candidates.append(entry)
+
+    for lang in languages:
+        for source in sources:
+            for entry in _ensure_list(source.get(lang)):
+                _add(entry)
     for source in sources:  # fallback to any remaining caption
         for entries in source.values():
             for entry in _ensure_list(entries):
-                text = _download_caption_entry(ydl, entry)
-                if text:
-                    return text
-    return None
-
+                _add(entry)
+    return candidates
 
-def _ordered_caption_sources(info: dict) -> List[dict]:
-    requested = info.get("requested_subtitles") or {}
-    subtitles = info.get("subtitles") or {}
-    automatic = info.get("automatic_captions") or {}
 
-    sources: List[dict] = []
-    if requested:
-        sources.append(requested)
-    if subtitles:
-        sources.append(subtitles)
-    if automatic:
-        sources.append(automatic)
-    return sources
+def _ordered_caption_sources(info: dict) -> Iterator[dict]:
+    for key in ("requested_subtitles", "subtitles", "automatic_captions"):
+        source = info.get(key)
+        if source:
+            yield source
 
 
 def _ensure_list(entries) -> List[dict]:
@@ -144,6 +322,52 @@ def _ensure_list(entries) -> List[dict]:
     return [entries]
 
 
+# Shared pooled session for caption downloads, built on first use. Keep-Alive
+# amortizes the TLS handshake across the many caption URLs of one run, and the
+# retry policy stops transient 429/5xx from surfacing as "Transcript missing".
+_CAPTION_SESSION = None
+
+
+def _caption_session():
+    global _CAPTION_SESSION
+    if _CAPTION_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
+        session = requests.Session()
+        adapter_kwargs: dict = {
+            "pool_connections": 8,
+            "pool_maxsize": 32,
+            "max_retries": Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        }
+        try:
+            # Optional on-disk HTTP cache: caption tracks ship Cache-Control
+            # headers, so retries and repeat runs can be served locally.
+            # CacheControlAdapter subclasses HTTPAdapter, so mounting it with
+            # the same kwargs layers caching on top of the retry/pool config
+            # (the CacheControl() wrapper would have replaced both).
+            from cachecontrol.adapter import CacheControlAdapter
+            from cachecontrol.caches.file_cache import FileCache
+
+            cache_dir = os.path.expanduser(
+                os.getenv(config.CACHE_DIR_ENV, config.DEFAULT_CACHE_DIR)
+            )
+            adapter = CacheControlAdapter(
+                cache=FileCache(os.path.join(cache_dir, "http")), **adapter_kwargs
+            )
+        except ImportError:  # pragma: no cover - optional dependency
+            adapter = HTTPAdapter(**adapter_kwargs)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _CAPTION_SESSION = session
+    return _CAPTION_SESSION
+
+
 def _download_caption_entry(ydl: YoutubeDL, entry: dict) -> str | None:
     url = entry.get("url")
     ext = (entry.get("ext") or "json3").lower()
@@ -151,14 +375,26 @@ def _download_caption_entry(ydl: YoutubeDL, entry: dict) -> str | None:
         return None
 
     try:
-        with closing(ydl.urlopen(url)) as response:
-            data = response.read()
+        response = _caption_session().get(url, timeout=(5, 30))
+        response.raise_for_status()
+        data = response.content
     except Exception:
+        # Signed or cookie-gated caption URLs may only work through yt-dlp's
+        # own URL handler; fall back to it before giving up.
+        try:
+            with closing(ydl.urlopen(url)) as response:
+                data = response.read()
+        except Exception:
+            return None
+
+    # Anything under 32 bytes cannot hold a caption payload ('{"events":[]}'
+    # and an empty WEBVTT header both land below it); skip parsing outright.
+    if len(data) < 32:
         return None
 
     if ext == "json3":
         try:
-            payload = json.loads(data.decode("utf-8"))
+            payload = _json_loads(data)
         except Exception:
             return None
         return _json3_payload_to_text(payload)
@@ -171,38 +407,35 @@ def _download_caption_entry(ydl: YoutubeDL, entry: dict) -> str | None:
 
 
 def _json3_payload_to_text(payload: dict) -> str:
-    segments: List[str] = []
-    for event in payload.get("events", []):
-        for seg in event.get("segs", []) or []:
-            chunk = seg.get("utf8", "").replace("\n", " ").strip()
-            if chunk:
-                segments.append(chunk)
-    return " ".join(segments).strip()
+    # chain.from_iterable flattens the events->segs nesting at C speed, and
+    # whitespace is normalised once at the end: a single split()/join pass
+    # over the full text replaces per-segment translate/strip calls.
+    segs = chain.from_iterable(
+        event.get("segs") or () for event in payload.get("events") or ()
+    )
+    joined = " ".join(seg.get("utf8", "") for seg in segs)
+    return " ".join(joined.split())
+
 
+# Cue indexes and timestamp lines, fused into one alternation so the hot
+# per-line path runs a single regex match. Both alternatives start with a
+# digit, so a cheap isdigit() prefilter skips the regex entirely for the
+# vast majority of lines, which are caption text.
+_SKIP_LINE_RE = re.compile(r"^(?:\d+$|\d{2}:\d{2}:\d{2}\.\d{3} --> )")
+_SKIP_PREFIXES = ("WEBVTT", "NOTE")
 
-TIMESTAMP_RE = re.compile(r"^\d{2}:\d{2}:\d{2}\.\d{3} --> ")
-CUE_INDEX_RE = re.compile(r"^\d+$")
 
 def _strip_caption_markup(raw_text: str) -> str:
-    lines: List[str] = []
-    for line in raw_text.splitlines():
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped.startswith("WEBVTT") or stripped.startswith("NOTE"):
-            continue
-        if TIMESTAMP_RE.match(stripped) or CUE_INDEX_RE.match(stripped):
-            continue
-        lines.append(stripped)
+    lines = [
+        stripped
+        for stripped in map(str.strip, raw_text.splitlines())
+        if stripped
+        and not stripped.startswith(_SKIP_PREFIXES)
+        and not (stripped[0].isdigit() and _SKIP_LINE_RE.match(stripped))
+    ]
     return " ".join(lines).strip()
 
 
 def _dedupe_preserve_order(values: List[str]) -> List[str]:
-    seen: set[str] = set()
-    ordered: List[str] = []
-    for value in values:
-        if not value or value in seen:
-            continue
-        seen.add(value)
-        ordered.append(value)
-    return ordered
+    # dict preserves insertion order, so fromkeys dedupes in one C-level pass.
+    return [value for value in dict.fromkeys(values) if value]